@@ -1,6 +1,8 @@
 """多智能体旅行规划系统"""
 
 import json
+import logging
+import threading
 from typing import Dict, Any, List
 from hello_agents import SimpleAgent
 from hello_agents.tools import MCPTool
@@ -8,6 +10,8 @@ from ..services.llm_service import get_llm
 from ..models.schemas import TripRequest, TripPlan, DayPlan, Attraction, Meal, WeatherInfo, Location, Hotel
 from ..config import get_settings
 
+logger = logging.getLogger(__name__)
+
 # ============ Agent提示词 ============
 
 ATTRACTION_AGENT_PROMPT = """你是景点搜索专家。你的任务是根据城市和用户偏好搜索合适的景点。
@@ -242,25 +246,25 @@ class MultiAgentTripPlanner:
             print("📍 步骤1: 搜索景点...")
             attraction_query = self._build_attraction_query(request)
             attraction_response = self.attraction_agent.run(attraction_query)
-            print(f"景点搜索结果: {attraction_response[:200]}...\n")
+            logger.debug("景点搜索结果: %.200s...", attraction_response)
 
             # 步骤2: 天气查询Agent查询天气
             print("🌤️  步骤2: 查询天气...")
             weather_query = f"请查询{request.city}的天气信息"
             weather_response = self.weather_agent.run(weather_query)
-            print(f"天气查询结果: {weather_response[:200]}...\n")
+            logger.debug("天气查询结果: %.200s...", weather_response)
 
             # 步骤3: 酒店推荐Agent搜索酒店
             print("🏨 步骤3: 搜索酒店...")
             hotel_query = f"请搜索{request.city}的{request.accommodation}酒店"
             hotel_response = self.hotel_agent.run(hotel_query)
-            print(f"酒店搜索结果: {hotel_response[:200]}...\n")
+            logger.debug("酒店搜索结果: %.200s...", hotel_response)
 
             # 步骤4: 行程规划Agent整合信息生成计划
             print("📋 步骤4: 生成行程计划...")
             planner_query = self._build_planner_query(request, attraction_response, weather_response, hotel_response)
             planner_response = self.planner_agent.run(planner_query)
-            print(f"行程规划结果: {planner_response[:300]}...\n")
+            logger.debug("行程规划结果: %.300s...", planner_response)
 
             # 解析最终计划
             trip_plan = self._parse_response(planner_response, request)
@@ -495,6 +499,7 @@ class MultiAgentTripPlanner:
 
 # 全局多智能体系统实例
 _multi_agent_planner = None
+_multi_agent_planner_lock = threading.Lock()
 
 
 def get_trip_planner_agent() -> MultiAgentTripPlanner:
@@ -502,7 +507,10 @@ def get_trip_planner_agent() -> MultiAgentTripPlanner:
     global _multi_agent_planner
 
     if _multi_agent_planner is None:
-        _multi_agent_planner = MultiAgentTripPlanner()
+        # 启动预热线程与首个请求可能同时进入,加锁避免重复初始化
+        with _multi_agent_planner_lock:
+            if _multi_agent_planner is None:
+                _multi_agent_planner = MultiAgentTripPlanner()
 
     return _multi_agent_planner
 
@@ -1,13 +1,20 @@
 """FastAPI主应用"""
 
+import asyncio
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from ..config import get_settings, validate_config, print_config
 from .routes import trip, poi, map as map_routes
+from ..agents.trip_planner_agent import get_trip_planner_agent
+from ..services.amap_service import get_amap_service
 
 # 获取配置
 settings = get_settings()
 
+# 配置日志级别(生产环境默认INFO,调试输出在isEnabledFor检查处即被跳过)
+logging.basicConfig(level=settings.log_level.upper())
+
 # 创建FastAPI应用
 app = FastAPI(
     title=settings.app_name,
@@ -26,6 +33,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 启动预热任务(保留引用,避免被垃圾回收)
+_warmup_task = None
+
 # 注册路由
 app.include_router(trip.router, prefix="/api")
 app.include_router(poi.router, prefix="/api")
@@ -51,12 +61,28 @@ async def startup_event():
         print("\n请检查.env文件并确保所有必要的配置项都已设置")
         raise
     
+    # 后台预热MCP工具与多智能体系统,不阻塞服务启动
+    global _warmup_task
+    _warmup_task = asyncio.create_task(asyncio.to_thread(_warm_up_services))
+
     print("\n" + "="*60)
     print("📚 API文档: http://localhost:8000/docs")
     print("📖 ReDoc文档: http://localhost:8000/redoc")
     print("="*60 + "\n")
 
 
+def _warm_up_services():
+    """预先初始化单例、计算健康检查快照并发起一次POI搜索,把冷启动开销移出首个请求"""
+    try:
+        amap = get_amap_service()
+        get_trip_planner_agent()
+        trip.refresh_health_snapshot()
+        amap.find_first_poi_with_location(keywords="机场", city="北京", citylimit=True)
+        print("✅ 服务预热完成")
+    except Exception as e:
+        print(f"⚠️  服务预热失败(首个请求将重新初始化): {str(e)}")
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """应用关闭事件"""
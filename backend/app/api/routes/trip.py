@@ -2,6 +2,9 @@
 
 import asyncio
 import os
+from itertools import islice
+from typing import Optional
+from async_timeout import timeout as atimeout
 from fastapi import APIRouter, HTTPException
 from ...models.schemas import (
     TripRequest,
@@ -10,14 +13,21 @@ from ...models.schemas import (
     TripPlan,
     DayPlan,
     Attraction,
-    Location,
     Meal,
 )
+from ...config import get_settings
 from ...agents.trip_planner_agent import get_trip_planner_agent
-from ...services.amap_service import get_amap_service
+from ...services.amap_service import get_amap_service, _is_coord_text
 
 router = APIRouter(prefix="/trip", tags=["旅行规划"])
 
+# MCP 简化行程每天使用的固定餐饮建议(只读，各天共享同一组实例)
+_DEFAULT_MEALS = (
+    Meal(type="breakfast", name="早餐推荐", description="根据当前位置/景点分布选择附近餐饮", estimated_cost=30),
+    Meal(type="lunch", name="午餐推荐", description="根据行程中途位置选择附近餐饮", estimated_cost=50),
+    Meal(type="dinner", name="晚餐推荐", description="根据当日结束点选择附近餐饮", estimated_cost=80),
+)
+
 
 @router.post(
     "/plan",
@@ -43,28 +53,21 @@ async def plan_trip(request: TripRequest):
         print(f"   天数: {request.travel_days}")
         print(f"{'='*60}\n")
 
-        departure_note = _build_departure_to_airport_note(request)
-
-        # 获取多智能体系统实例
-        print("🔄 获取多智能体系统实例...")
-        planner = get_trip_planner_agent()
+        # 出发交通说明（MCP POI + 路线）与主行程生成（LLM/MCP）互不依赖，并发执行
+        # 单次请求内共享的POI详情备忘，两条并发链路查到同一POI时只请求一次
+        detail_cache: dict[str, dict] = {}
+        note_task = asyncio.create_task(
+            asyncio.to_thread(_build_departure_to_airport_note, request, detail_cache)
+        )
+        plan_task = asyncio.create_task(_generate_trip_plan(request, detail_cache))
+        departure_note, trip_plan = await asyncio.gather(note_task, plan_task, return_exceptions=True)
 
-        # 如果未配置 LLM Key，则跳过 LLM，直接用 MCP POI 生成一个可用行程
-        llm_api_key = os.getenv("LLM_API_KEY") or os.getenv("OPENAI_API_KEY")
-        if not llm_api_key:
-            print("⚠️  未检测到 LLM_API_KEY/OPENAI_API_KEY，使用 MCP 生成简化行程")
-            trip_plan = _build_plan_from_mcp(request)
-        else:
-            # 生成旅行计划（增加超时保护，避免外部工具/LLM卡住导致前端Network Error）
-            print("🚀 开始生成旅行计划...")
-            try:
-                trip_plan = await asyncio.wait_for(
-                    asyncio.to_thread(planner.plan_trip, request),
-                    timeout=120,
-                )
-            except TimeoutError:
-                print("⚠️  生成旅行计划超时，改用 MCP 生成简化行程")
-                trip_plan = _build_plan_from_mcp(request)
+        if isinstance(trip_plan, BaseException):
+            raise trip_plan
+        if isinstance(departure_note, BaseException):
+            # 出发说明失败不影响主行程
+            print(f"⚠️  生成出发交通说明失败: {str(departure_note)}")
+            departure_note = ""
 
         if departure_note and trip_plan:
             try:
@@ -91,14 +94,37 @@ async def plan_trip(request: TripRequest):
         )
 
 
-def _build_plan_from_mcp(request: TripRequest) -> TripPlan:
+async def _generate_trip_plan(request: TripRequest, detail_cache: Optional[dict] = None) -> TripPlan:
+    """生成主行程：有 LLM Key 时走多智能体，否则/超时时回退到 MCP 简化行程。"""
+
+    # 获取多智能体系统实例
+    print("🔄 获取多智能体系统实例...")
+    planner = get_trip_planner_agent()
+
+    # 如果未配置 LLM Key，则跳过 LLM，直接用 MCP POI 生成一个可用行程
+    llm_api_key = os.getenv("LLM_API_KEY") or os.getenv("OPENAI_API_KEY")
+    if not llm_api_key:
+        print("⚠️  未检测到 LLM_API_KEY/OPENAI_API_KEY，使用 MCP 生成简化行程")
+        return await asyncio.to_thread(_build_plan_from_mcp, request, detail_cache)
+
+    # 生成旅行计划（增加超时保护，避免外部工具/LLM卡住导致前端Network Error）
+    print("🚀 开始生成旅行计划...")
+    try:
+        async with atimeout(get_settings().llm_timeout_s):
+            return await asyncio.to_thread(planner.plan_trip, request)
+    except asyncio.TimeoutError:
+        print("⚠️  生成旅行计划超时，改用 MCP 生成简化行程")
+        return await asyncio.to_thread(_build_plan_from_mcp, request, detail_cache)
+
+
+def _build_plan_from_mcp(request: TripRequest, detail_cache: Optional[dict] = None) -> TripPlan:
     """不依赖 LLM：直接用 MCP POI 搜索结果拼一个可展示的行程。"""
 
     from datetime import datetime, timedelta
 
     amap = get_amap_service()
     keywords = request.preferences[0] if request.preferences else "景点"
-    pois = amap.search_poi(keywords=keywords, city=request.city, citylimit=True)
+    pois = amap.search_poi(keywords=keywords, city=request.city, citylimit=True, detail_cache=detail_cache)
 
     if not pois:
         # MCP 没拿到数据，回退到原有兜底（仍然保证可用）
@@ -107,25 +133,25 @@ def _build_plan_from_mcp(request: TripRequest) -> TripPlan:
 
     # 每天 2-3 个 POI
     per_day = 3 if request.travel_days == 1 else 2
-    idx = 0
+    iter_pois = iter(pois)
     days: list[DayPlan] = []
 
     try:
-        start_dt = datetime.strptime(request.start_date, "%Y-%m-%d")
+        start_dt = datetime.fromisoformat(request.start_date)
     except Exception:
         start_dt = datetime.now()
+    dates = [(start_dt + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(request.travel_days)]
 
     for day_index in range(request.travel_days):
-        day_pois = pois[idx : idx + per_day]
-        if not day_pois:
-            day_pois = pois[:per_day]
-        idx += per_day
+        # POI 用完后后续天数复用前几个
+        day_pois = islice(iter_pois, per_day) if day_index * per_day < len(pois) else islice(pois, per_day)
 
+        # 字段均来自已规整的 POIInfo，直接 model_construct 跳过重复校验
         attractions = [
-            Attraction(
+            Attraction.model_construct(
                 name=p.name,
                 address=p.address,
-                location=Location(longitude=p.location.longitude, latitude=p.location.latitude),
+                location=p.location,
                 visit_duration=120,
                 description=f"来自高德地图POI搜索: {p.type}" if p.type else "来自高德地图POI搜索",
                 category="景点",
@@ -134,21 +160,15 @@ def _build_plan_from_mcp(request: TripRequest) -> TripPlan:
             for p in day_pois
         ]
 
-        meals = [
-            Meal(type="breakfast", name="早餐推荐", description="根据当前位置/景点分布选择附近餐饮", estimated_cost=30),
-            Meal(type="lunch", name="午餐推荐", description="根据行程中途位置选择附近餐饮", estimated_cost=50),
-            Meal(type="dinner", name="晚餐推荐", description="根据当日结束点选择附近餐饮", estimated_cost=80),
-        ]
-
         days.append(
             DayPlan(
-                date=(start_dt + timedelta(days=day_index)).strftime("%Y-%m-%d"),
+                date=dates[day_index],
                 day_index=day_index,
                 description=f"第{day_index+1}天行程（基于高德地图POI: {keywords}）",
                 transportation=request.transportation,
                 accommodation=request.accommodation,
                 attractions=attractions,
-                meals=meals,
+                meals=list(_DEFAULT_MEALS),
             )
         )
 
@@ -163,7 +183,7 @@ def _build_plan_from_mcp(request: TripRequest) -> TripPlan:
     )
 
 
-def _build_departure_to_airport_note(request: TripRequest) -> str:
+def _build_departure_to_airport_note(request: TripRequest, detail_cache: Optional[dict] = None) -> str:
     """生成“当前位置(GPS) → 目的地城市机场”的出发交通说明。
 
     设计目标：
@@ -179,7 +199,9 @@ def _build_departure_to_airport_note(request: TripRequest) -> str:
     origin = f"{loc.longitude},{loc.latitude}"
 
     amap = get_amap_service()
-    airport = amap.find_first_poi_with_location(keywords="机场", city=request.city, citylimit=True, max_candidates=5)
+    airport = amap.find_first_poi_with_location(
+        keywords="机场", city=request.city, citylimit=True, max_candidates=5, detail_cache=detail_cache
+    )
     if not airport:
         return (
             "出发交通建议（基于GPS定位）：已获取你的当前位置，但未能在目的地城市搜索到机场POI，"
@@ -189,6 +211,22 @@ def _build_departure_to_airport_note(request: TripRequest) -> str:
     dest_coord = f"{airport.location.longitude},{airport.location.latitude}"
     airport_name = airport.name or f"{request.city}机场"
 
+    accuracy_part = ""
+    if loc.accuracy_m is not None:
+        try:
+            accuracy_part = f"（精度±{int(round(loc.accuracy_m))}m）"
+        except Exception:
+            accuracy_part = ""
+
+    fallback_note = (
+        f"出发交通建议（基于GPS定位{accuracy_part}）：从你当前位置前往{request.city}的{airport_name}。"
+        "路线规划结果解析失败，已按目的地城市继续生成行程。"
+    )
+
+    # 坐标异常(如 nan/科学计数法)时路线规划必然失败，直接返回，省掉一次 MCP 往返
+    if not _is_coord_text(origin) or not _is_coord_text(dest_coord):
+        return fallback_note
+
     # 跨城出行默认用 driving（最稳，不依赖起点城市参数）
     route = amap.plan_route(
         origin_address=origin,
@@ -198,13 +236,6 @@ def _build_departure_to_airport_note(request: TripRequest) -> str:
         route_type="driving",
     )
 
-    accuracy_part = ""
-    if loc.accuracy_m is not None:
-        try:
-            accuracy_part = f"（精度±{int(round(loc.accuracy_m))}m）"
-        except Exception:
-            accuracy_part = ""
-
     summary = ""
     if isinstance(route, dict):
         summary = str(route.get("summary") or "").strip()
@@ -214,34 +245,57 @@ def _build_departure_to_airport_note(request: TripRequest) -> str:
             f"出发交通建议（基于GPS定位{accuracy_part}）：从你当前位置前往{request.city}的{airport_name}。{summary}"
         )
 
-    return (
-        f"出发交通建议（基于GPS定位{accuracy_part}）：从你当前位置前往{request.city}的{airport_name}。"
-        "路线规划结果解析失败，已按目的地城市继续生成行程。"
-    )
+    return fallback_note
+
+
+# 健康检查快照：启动时计算一次，负载均衡探针直接返回，不再每次遍历智能体工具
+_HEALTH_SNAPSHOT: dict = {}
+
+
+def refresh_health_snapshot() -> dict:
+    """实时检查多智能体系统并刷新健康检查快照"""
+    global _HEALTH_SNAPSHOT
+    planner = get_trip_planner_agent()
+
+    payload = {
+        "status": "healthy",
+        "service": "trip-planner",
+        "planner_agent_name": getattr(planner.planner_agent, "name", "") if getattr(planner, "planner_agent", None) else "",
+        "sub_agents": {
+            "attraction_tools": len(planner.attraction_agent.list_tools()) if getattr(planner, "attraction_agent", None) else 0,
+            "weather_tools": len(planner.weather_agent.list_tools()) if getattr(planner, "weather_agent", None) else 0,
+            "hotel_tools": len(planner.hotel_agent.list_tools()) if getattr(planner, "hotel_agent", None) else 0,
+        },
+        "has_shared_amap_tool": bool(getattr(planner, "amap_tool", None)),
+    }
+    # 整体替换而不是原地修改，避免探针读到空快照或序列化时字典被改动
+    _HEALTH_SNAPSHOT = payload
+    return payload
 
 
 @router.get(
     "/health",
     summary="健康检查",
-    description="检查旅行规划服务是否正常"
+    description="返回启动时缓存的旅行规划服务状态"
 )
 async def health_check():
     """健康检查"""
-    try:
-        # 检查多智能体系统是否可用
-        planner = get_trip_planner_agent()
+    snapshot = _HEALTH_SNAPSHOT
+    if snapshot:
+        return snapshot
+    # 启动预热尚未完成时实时检查一次
+    return await health_check_deep()
+
 
-        return {
-            "status": "healthy",
-            "service": "trip-planner",
-            "planner_agent_name": getattr(planner.planner_agent, "name", "") if getattr(planner, "planner_agent", None) else "",
-            "sub_agents": {
-                "attraction_tools": len(planner.attraction_agent.list_tools()) if getattr(planner, "attraction_agent", None) else 0,
-                "weather_tools": len(planner.weather_agent.list_tools()) if getattr(planner, "weather_agent", None) else 0,
-                "hotel_tools": len(planner.hotel_agent.list_tools()) if getattr(planner, "hotel_agent", None) else 0,
-            },
-            "has_shared_amap_tool": bool(getattr(planner, "amap_tool", None)),
-        }
+@router.get(
+    "/health/deep",
+    summary="深度健康检查",
+    description="实时检查多智能体系统及其工具是否正常"
+)
+async def health_check_deep():
+    """深度健康检查"""
+    try:
+        return await asyncio.to_thread(refresh_health_snapshot)
     except Exception as e:
         raise HTTPException(
             status_code=503,
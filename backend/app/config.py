@@ -43,6 +43,9 @@ class Settings(BaseSettings):
     openai_base_url: str = "https://api.openai.com/v1"
     openai_model: str = "gpt-4"
 
+    # LLM行程生成超时(秒),超时后回退到MCP简化行程
+    llm_timeout_s: int = 120
+
     # 日志配置
     log_level: str = "INFO"
 
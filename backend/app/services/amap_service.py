@@ -2,22 +2,84 @@
 
 from typing import List, Dict, Any, Optional
 import ast
+import atexit
+import functools
 import json
+import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 from hello_agents.tools import MCPTool
 from ..config import get_settings
 from ..models.schemas import Location, POIInfo, WeatherInfo
 
+logger = logging.getLogger(__name__)
+
 # 全局MCP工具实例
 _amap_mcp_tool = None
 
+# 服务级共享线程池的大小，即对 MCP 子进程的最大并发请求数
+_POOL_MAX_WORKERS = 16
+
+# POI 结果缓存：同一城市的 POI 在几分钟到几小时内基本不变
+_POI_CACHE_MAXSIZE = 512
+_POI_CACHE_TTL_S = 600
+
+
+_BRACKET_PAIRS = {"{": "}", "[": "]"}
+
+# MCP 返回的 POI/路线 JSON 较大，优先用 orjson 解析(直接接受 str)；未安装时退回标准库
+try:
+    from orjson import JSONDecodeError as _FastJSONDecodeError, loads as _fast_json_loads
+except ImportError:
+    _FastJSONDecodeError = None
+    _fast_json_loads = json.loads
+
+
+def _json_loads(text: str) -> Any:
+    try:
+        return _fast_json_loads(text)
+    except Exception as e:
+        # orjson 不接受 NaN/Infinity 和超出 64 位的整数，标准库可以，再试一次
+        if _FastJSONDecodeError is not None and isinstance(e, _FastJSONDecodeError):
+            return json.loads(text)
+        raise
+
+
+def _find_balanced_end(text: str, start: int) -> int:
+    """从 text[start] 处的 { 或 [ 开始，单次扫描找到与之配对的闭合括号位置；找不到返回 -1。"""
+    stack: list[str] = []
+    quote: Optional[str] = None
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == quote:
+                quote = None
+            continue
+        if ch == '"' or ch == "'":
+            quote = ch
+        elif ch in _BRACKET_PAIRS:
+            stack.append(_BRACKET_PAIRS[ch])
+        elif ch == "}" or ch == "]":
+            if not stack or stack.pop() != ch:
+                return -1
+            if not stack:
+                return i
+    return -1
+
 
 def _try_parse_mcp_payload(raw: Any) -> Any:
     """尽量把 MCPTool.run 返回的内容解析为 Python 对象。
 
     MCP 返回可能是：
-    - JSON 字符串
-    - 含说明文字的 JSON 片段
+    - JSON 字符串(绝大多数情况，直接 _json_loads)
+    - 含说明文字的 JSON 片段(截取配对括号内的部分)
     - Python dict 字符串(单引号)
     """
 
@@ -32,36 +94,50 @@ def _try_parse_mcp_payload(raw: Any) -> Any:
 
     # 1) 直接当 JSON
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except Exception:
         pass
 
-    # 2) 从文本中截取 JSON 对象/数组
-    for open_ch, close_ch in (("{", "}"), ("[", "]")):
-        start = text.find(open_ch)
-        end = text.rfind(close_ch)
-        if start != -1 and end != -1 and end > start:
-            snippet = text[start : end + 1]
-            try:
-                return json.loads(snippet)
-            except Exception:
-                # 3) 尝试按 Python literal 解析(单引号等)
-                try:
-                    return ast.literal_eval(snippet)
-                except Exception:
-                    pass
-
-    # 4) 正则抓取第一个 JSON 块(兜底)
-    m = re.search(r"(\{.*\}|\[.*\])", text, re.DOTALL)
-    if m:
-        snippet = m.group(1)
+    # 2) 从第一个 { 或 [ 起单次扫描，依次截取括号配对完整的片段：
+    #    - 说明文字里的 "[below]" 等解析失败时，从该片段结束处之后继续找，不会回到片段内部
+    #    - 遇到括号无法配对(如被截断)的片段就停止，避免把内部嵌套对象当成整个结果
+    #    - 说明文字里也可能有 "[1]" 这类可解析片段，取解析成功的最长片段
+    best = None
+    best_len = 0
+    # 分别记住下一个 { 和 [ 的位置，只在越过后才重新查找，保证整体仍是单次扫描
+    next_obj = text.find("{")
+    next_arr = text.find("[")
+    while next_obj != -1 or next_arr != -1:
+        start = min(i for i in (next_obj, next_arr) if i != -1)
+        end = _find_balanced_end(text, start)
+        if end == -1:
+            break
+        data = _parse_payload_snippet(text[start : end + 1])
+        if data is not None and end + 1 - start > best_len:
+            best, best_len = data, end + 1 - start
+        if next_obj != -1 and next_obj <= end:
+            next_obj = text.find("{", end + 1)
+        if next_arr != -1 and next_arr <= end:
+            next_arr = text.find("[", end + 1)
+
+    return best
+
+
+def _parse_payload_snippet(snippet: str) -> Any:
+    """把括号配对完整的片段解析为 dict/list，失败返回 None。"""
+    try:
+        return _json_loads(snippet)
+    except Exception:
+        pass
+
+    # 3) 单引号的 Python literal(如 dict 的 repr)
+    if snippet[1:].lstrip().startswith("'") or ": '" in snippet:
         try:
-            return json.loads(snippet)
+            data = ast.literal_eval(snippet)
         except Exception:
-            try:
-                return ast.literal_eval(snippet)
-            except Exception:
-                return None
+            return None
+        if isinstance(data, (dict, list)):
+            return data
 
     return None
 
@@ -76,24 +152,145 @@ def _parse_location_str(loc: Any) -> Optional[Location]:
             return None
 
     # AMap 常见格式: "lng,lat"
-    if isinstance(loc, str) and "," in loc:
-        try:
-            lng_str, lat_str = loc.split(",", 1)
-            return Location(longitude=float(lng_str), latitude=float(lat_str))
-        except Exception:
+    if isinstance(loc, str):
+        coords = _parse_loc_tuple(loc)
+        if coords is None:
             return None
+        return Location(longitude=coords[0], latitude=coords[1])
     return None
 
 
-def _dig_first(d: Any, path: list[str]) -> Any:
+@functools.lru_cache(maxsize=4096)
+def _parse_loc_tuple(loc: str) -> Optional[tuple[float, float]]:
+    """解析 "lng,lat" 字符串；同一坐标串在一次行程里会被反复解析，结果做缓存。"""
+    lng_str, sep, lat_str = loc.partition(",")
+    if not sep:
+        return None
+    try:
+        return float(lng_str), float(lat_str)
+    except ValueError:
+        return None
+
+
+# POI 各字段的候选键名(按优先级)
+_ID_KEYS = ("id", "poi_id", "uid")
+_TYPE_KEYS = ("type", "typecode")
+_ADDRESS_KEYS = ("address", "addr")
+_LOCATION_KEYS = ("location", "lnglat")
+
+
+def _first(d: Dict[str, Any], keys: tuple, default: Any = "") -> Any:
+    """返回 keys 中第一个取到真值的字段，都没有时返回 default。"""
+    for key in keys:
+        value = d.get(key)
+        if value:
+            return value
+    return default
+
+
+def _extract_poi_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    """从 maps_text_search 的单条结果中提取 POI 字段(兼容多种键名)。"""
+    return {
+        "id": _first(item, _ID_KEYS),
+        "name": item.get("name") or "",
+        "type": _first(item, _TYPE_KEYS),
+        "address": _first(item, _ADDRESS_KEYS),
+        "location": _parse_location_str(_first(item, _LOCATION_KEYS, None)),
+        "tel": item.get("tel"),
+    }
+
+
+def _merge_poi_detail(fields: Dict[str, Any], detail: Any) -> Dict[str, Any]:
+    """用 maps_search_detail 的结果补齐坐标/类型等字段。"""
+    if isinstance(detail, dict):
+        # detail 往往包含 location/type/rating 等
+        fields["location"] = _parse_location_str(detail.get("location"))
+        fields["type"] = detail.get("type") or fields["type"]
+        fields["name"] = detail.get("name") or fields["name"]
+        fields["address"] = detail.get("address") or fields["address"]
+    return fields
+
+
+def _poi_info_from_fields(fields: Dict[str, Any]) -> POIInfo:
+    """字段均已规整为 str/Location，直接 model_construct 跳过 Pydantic 校验。"""
+    tel = fields["tel"]
+    return POIInfo.model_construct(
+        id=str(fields["id"]),
+        name=str(fields["name"]),
+        type=str(fields["type"]),
+        address=str(fields["address"]),
+        location=fields["location"],
+        # 高德无电话时可能返回 [] 等非字符串
+        tel=tel if isinstance(tel, str) and tel else None,
+    )
+
+
+def _dig_first(d: Any, path: tuple) -> Any:
+    """按路径逐层取值：字符串键取 dict，整数键取 list 下标；任一层不匹配返回 None。"""
     cur = d
     for key in path:
-        if not isinstance(cur, dict):
+        if isinstance(cur, dict):
+            cur = cur.get(key)
+        elif isinstance(cur, list) and isinstance(key, int) and -len(cur) <= key < len(cur):
+            cur = cur[key]
+        else:
             return None
-        cur = cur.get(key)
     return cur
 
 
+def _dig_any(d: Any, paths: tuple) -> Any:
+    """依次尝试多条路径，返回第一个非空值。"""
+    for path in paths:
+        value = _dig_first(d, path)
+        if value is not None and value != "":
+            return value
+    return None
+
+
+# 兼容 AMap 常见结构
+# driving/walking: route.paths[0].distance/duration/steps[].instruction
+# transit: route.transits[0].distance/duration/segments
+# route 可能位于顶层、data 或 result 下；兜底时 distance/duration 直接在顶层或 data 下
+_ROUTE_PREFIXES = (("route",), ("data", "route"), ("result", "route"))
+
+
+def _route_field_paths(leg: str, field: str) -> tuple:
+    return tuple(prefix + (leg, 0, field) for prefix in _ROUTE_PREFIXES) + ((field,), ("data", field))
+
+
+_PATHS_DISTANCE = _route_field_paths("paths", "distance")
+_PATHS_DURATION = _route_field_paths("paths", "duration")
+_PATHS_STEPS = tuple(prefix + ("paths", 0, "steps") for prefix in _ROUTE_PREFIXES)
+_TRANSITS_DISTANCE = _route_field_paths("transits", "distance")
+_TRANSITS_DURATION = _route_field_paths("transits", "duration")
+
+
+def _extract_paths(data: Any) -> tuple[Optional[float], Optional[int], list[str]]:
+    """driving/walking：距离、时长与前几步导航指令。"""
+    instructions: list[str] = []
+    steps = _dig_any(data, _PATHS_STEPS)
+    if isinstance(steps, list):
+        for step in steps:
+            if isinstance(step, dict) and step.get("instruction"):
+                instructions.append(str(step["instruction"]))
+                if len(instructions) >= 4:
+                    break
+    return (
+        _as_float(_dig_any(data, _PATHS_DISTANCE)),
+        _as_int(_dig_any(data, _PATHS_DURATION)),
+        instructions,
+    )
+
+
+def _extract_transits(data: Any) -> tuple[Optional[float], Optional[int], list[str]]:
+    """transit：距离与时长(公交方案不提供逐步指令)。"""
+    return (
+        _as_float(_dig_any(data, _TRANSITS_DISTANCE)),
+        _as_int(_dig_any(data, _TRANSITS_DURATION)),
+        [],
+    )
+
+
 def _as_float(value: Any) -> Optional[float]:
     try:
         if value is None:
@@ -145,7 +342,12 @@ _COORD_RE = re.compile(r"^\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*$")
 def _is_coord_text(text: Optional[str]) -> bool:
     if not text:
         return False
-    return bool(_COORD_RE.match(str(text)))
+    return _match_coord_text(str(text))
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_coord_text(text: str) -> bool:
+    return bool(_COORD_RE.match(text))
 
 
 def get_amap_mcp_tool() -> MCPTool:
@@ -192,8 +394,32 @@ class AmapService:
     def __init__(self):
         """初始化服务"""
         self.mcp_tool = get_amap_mcp_tool()
-    
-    def search_poi(self, keywords: str, city: str, citylimit: bool = True) -> List[POIInfo]:
+        self._poi_cache: TTLCache = TTLCache(maxsize=_POI_CACHE_MAXSIZE, ttl=_POI_CACHE_TTL_S)
+        self._poi_cache_lock = threading.Lock()
+        # 所有 MCP 并发请求共用一个线程池，避免每次请求都新建线程
+        self._pool = ThreadPoolExecutor(max_workers=_POOL_MAX_WORKERS, thread_name_prefix="amap")
+        atexit.register(self._pool.shutdown)
+
+    def _cache_get(self, key: tuple) -> Any:
+        with self._poi_cache_lock:
+            value = self._poi_cache.get(key)
+        logger.debug("POI缓存%s: %s", "命中" if value is not None else "未命中", key)
+        return value
+
+    def _cache_set(self, key: tuple, value: Any) -> None:
+        # 只缓存成功解析出的结果，失败/空结果下次仍会重试
+        if not value:
+            return
+        with self._poi_cache_lock:
+            self._poi_cache[key] = value
+
+    def search_poi(
+        self,
+        keywords: str,
+        city: str,
+        citylimit: bool = True,
+        detail_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> List[POIInfo]:
         """
         搜索POI
         
@@ -201,10 +427,27 @@ class AmapService:
             keywords: 搜索关键词
             city: 城市
             citylimit: 是否限制在城市范围内
+            detail_cache: 单次请求内共享的POI详情备忘(poi_id -> 详情)
             
         Returns:
             POI信息列表
         """
+        key = ("maps_text_search", keywords, city, citylimit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached)
+
+        parsed = self._search_poi(keywords, city, citylimit, detail_cache)
+        self._cache_set(key, parsed)
+        return list(parsed)
+
+    def _search_poi(
+        self,
+        keywords: str,
+        city: str,
+        citylimit: bool,
+        detail_cache: Optional[Dict[str, Dict[str, Any]]],
+    ) -> List[POIInfo]:
         try:
             # 调用MCP工具
             result = self.mcp_tool.run({
@@ -217,7 +460,7 @@ class AmapService:
                 }
             })
             
-            print(f"POI搜索结果: {str(result)[:200]}...")  # 打印前200字符
+            logger.debug("POI搜索结果: %.200s...", result)
 
             data = _try_parse_mcp_payload(result)
             if data is None:
@@ -239,48 +482,38 @@ class AmapService:
             if not pois:
                 return []
 
-            parsed: List[POIInfo] = []
             # 为了生成行程，优先保证前若干个 POI 有坐标；缺坐标时用详情接口补齐
             max_collect = 15
-            for item in pois:
-                if not isinstance(item, dict):
-                    continue
-
-                poi_id = item.get("id") or item.get("poi_id") or item.get("uid") or ""
-                name = item.get("name") or ""
-                poi_type = item.get("type") or item.get("typecode") or ""
-                address = item.get("address") or item.get("addr") or ""
-                location = _parse_location_str(item.get("location") or item.get("lnglat"))
-
-                # 有些 maps_text_search 返回不含 location，需要再调 detail 补齐
-                if not location and poi_id:
-                    detail = self.get_poi_detail(str(poi_id))
-                    if isinstance(detail, dict):
-                        # detail 往往包含 location/type/rating 等
-                        location = _parse_location_str(detail.get("location"))
-                        poi_type = detail.get("type") or poi_type
-                        name = detail.get("name") or name
-                        address = detail.get("address") or address
-
-                if not location:
-                    # 仍拿不到坐标就跳过
-                    continue
-
-                parsed.append(
-                    POIInfo(
-                        id=str(poi_id),
-                        name=str(name),
-                        type=str(poi_type),
-                        address=str(address),
-                        location=location,
-                        tel=item.get("tel"),
-                    )
-                )
-
-                if len(parsed) >= max_collect:
+            candidates = [
+                _extract_poi_fields(item) for item in pois[: max_collect * 2] if isinstance(item, dict)
+            ]
+
+            # 有些 maps_text_search 返回不含 location，需要再调 detail 补齐。
+            # 按排名只补齐凑满 max_collect 所需的候选，同一批详情请求并发发出；
+            # 有补齐失败的再顺延到后面的候选
+            get_detail = functools.partial(self.get_poi_detail, detail_cache=detail_cache)
+            tried: set[int] = set()
+            while True:
+                batch: list[int] = []
+                slots = 0
+                for i, fields in enumerate(candidates):
+                    if slots >= max_collect:
+                        break
+                    if fields["location"]:
+                        slots += 1
+                    elif fields["id"] and i not in tried:
+                        batch.append(i)
+                        slots += 1
+                if not batch:
                     break
-
-            return parsed
+                tried.update(batch)
+                details = self._pool.map(get_detail, [str(candidates[i]["id"]) for i in batch])
+                for i, detail in zip(batch, details):
+                    _merge_poi_detail(candidates[i], detail)
+
+            # 仍拿不到坐标就跳过；先筛选再构造，超出 max_collect 的候选不再建模型
+            located = [c for c in candidates if c["location"]][:max_collect]
+            return [_poi_info_from_fields(fields) for fields in located]
             
         except Exception as e:
             print(f"❌ POI搜索失败: {str(e)}")
@@ -292,13 +525,33 @@ class AmapService:
         city: str,
         citylimit: bool = True,
         max_candidates: int = 5,
+        detail_cache: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Optional[POIInfo]:
         """更快地拿到“第一个可用 POI（带坐标）”。
 
         用于像“机场/火车站”等场景：我们只需要一个目的地坐标，不需要收集很多 POI，
         避免 search_poi 为补坐标触发大量详情请求。
+
+        detail_cache 为单次请求内共享的 POI 详情备忘，与 search_poi 共用可避免重复请求同一详情。
         """
 
+        key = ("maps_text_search:first", keywords, city, citylimit, max_candidates)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        poi = self._find_first_poi_with_location(keywords, city, citylimit, max_candidates, detail_cache)
+        self._cache_set(key, poi)
+        return poi
+
+    def _find_first_poi_with_location(
+        self,
+        keywords: str,
+        city: str,
+        citylimit: bool,
+        max_candidates: int,
+        detail_cache: Optional[Dict[str, Dict[str, Any]]],
+    ) -> Optional[POIInfo]:
         try:
             result = self.mcp_tool.run(
                 {
@@ -327,39 +580,32 @@ class AmapService:
             if not pois:
                 return None
 
-            checked = 0
-            for item in pois:
-                if not isinstance(item, dict):
-                    continue
-                checked += 1
-                if checked > max_candidates:
+            candidates = [_extract_poi_fields(item) for item in pois if isinstance(item, dict)][:max_candidates]
+
+            # 排在第一个自带坐标的候选之前、缺坐标的候选需要详情补齐，这些详情请求并发发出
+            ranked: list[Dict[str, Any]] = []
+            for fields in candidates:
+                if fields["location"] or fields["id"]:
+                    ranked.append(fields)
+                if fields["location"]:
                     break
 
-                poi_id = item.get("id") or item.get("poi_id") or item.get("uid") or ""
-                name = item.get("name") or ""
-                poi_type = item.get("type") or item.get("typecode") or ""
-                address = item.get("address") or item.get("addr") or ""
-                location = _parse_location_str(item.get("location") or item.get("lnglat"))
-
-                if not location and poi_id:
-                    detail = self.get_poi_detail(str(poi_id))
-                    if isinstance(detail, dict):
-                        location = _parse_location_str(detail.get("location"))
-                        poi_type = detail.get("type") or poi_type
-                        name = detail.get("name") or name
-                        address = detail.get("address") or address
-
-                if not location:
-                    continue
-
-                return POIInfo(
-                    id=str(poi_id),
-                    name=str(name),
-                    type=str(poi_type),
-                    address=str(address),
-                    location=location,
-                    tel=item.get("tel"),
-                )
+            futures = {
+                idx: self._pool.submit(self.get_poi_detail, str(fields["id"]), detail_cache)
+                for idx, fields in enumerate(ranked)
+                if not fields["location"]
+            }
+            try:
+                # 按搜索排名取结果，而不是按哪个详情请求先返回
+                for idx, fields in enumerate(ranked):
+                    if idx in futures:
+                        _merge_poi_detail(fields, futures[idx].result())
+                    if fields["location"]:
+                        return _poi_info_from_fields(fields)
+            finally:
+                # 已拿到结果时取消尚未开始的详情请求
+                for future in futures.values():
+                    future.cancel()
 
             return None
 
@@ -387,7 +633,7 @@ class AmapService:
                 }
             })
             
-            print(f"天气查询结果: {result[:200]}...")
+            logger.debug("天气查询结果: %.200s...", result)
             
             # TODO: 解析实际的天气数据
             return []
@@ -464,57 +710,15 @@ class AmapService:
                 "arguments": arguments
             })
 
-            print(f"路线规划结果: {str(result)[:200]}...")
+            logger.debug("路线规划结果: %.200s...", result)
 
             data = _try_parse_mcp_payload(result)
             if data is None:
                 return {"raw": result}
 
-            # 兼容 AMap 常见结构
-            # driving/walking: route.paths[0].distance/duration/steps[].instruction
-            # transit: route.transits[0].distance/duration/segments
-            route = None
-            if isinstance(data, dict):
-                route = data.get("route")
-                if route is None and isinstance(data.get("data"), dict):
-                    route = data["data"].get("route")
-                if route is None and isinstance(data.get("result"), dict):
-                    route = data["result"].get("route")
-
-            distance_m: Optional[float] = None
-            duration_s: Optional[int] = None
-            instructions: list[str] = []
-
-            if isinstance(route, dict):
-                # driving/walking
-                paths = route.get("paths")
-                if isinstance(paths, list) and paths:
-                    first = paths[0] if isinstance(paths[0], dict) else None
-                    if isinstance(first, dict):
-                        distance_m = _as_float(first.get("distance"))
-                        duration_s = _as_int(first.get("duration"))
-                        steps = first.get("steps")
-                        if isinstance(steps, list):
-                            for step in steps:
-                                if isinstance(step, dict) and step.get("instruction"):
-                                    instructions.append(str(step["instruction"]))
-                                    if len(instructions) >= 4:
-                                        break
-
-                # transit
-                if distance_m is None and duration_s is None:
-                    transits = route.get("transits")
-                    if isinstance(transits, list) and transits:
-                        first_t = transits[0] if isinstance(transits[0], dict) else None
-                        if isinstance(first_t, dict):
-                            distance_m = _as_float(first_t.get("distance"))
-                            duration_s = _as_int(first_t.get("duration"))
-
-            # 兜底：有些 MCP 会把 distance/duration 顶层返回
-            if distance_m is None and isinstance(data, dict):
-                distance_m = _as_float(data.get("distance") or _dig_first(data, ["data", "distance"]))
-            if duration_s is None and isinstance(data, dict):
-                duration_s = _as_int(data.get("duration") or _dig_first(data, ["data", "duration"]))
+            # 按路线类型直接选定响应结构，不再对已知不存在的结构做查找
+            extractor = _extract_transits if route_type == "transit" else _extract_paths
+            distance_m, duration_s, instructions = extractor(data)
 
             summary = f"距离{_format_distance_m(distance_m)}，{_format_duration_s(duration_s)}"
             if instructions:
@@ -555,7 +759,7 @@ class AmapService:
                 "arguments": arguments
             })
 
-            print(f"地理编码结果: {result[:200]}...")
+            logger.debug("地理编码结果: %.200s...", result)
 
             # TODO: 解析实际的坐标数据
             return None
@@ -564,16 +768,36 @@ class AmapService:
             print(f"❌ 地理编码失败: {str(e)}")
             return None
 
-    def get_poi_detail(self, poi_id: str) -> Dict[str, Any]:
+    def get_poi_detail(
+        self,
+        poi_id: str,
+        detail_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """
         获取POI详情
 
         Args:
             poi_id: POI ID
+            detail_cache: 单次请求内共享的POI详情备忘(poi_id -> 详情)
 
         Returns:
             POI详情信息
         """
+        if detail_cache is not None and poi_id in detail_cache:
+            return detail_cache[poi_id]
+
+        key = ("maps_search_detail", poi_id)
+        detail = self._cache_get(key)
+        if detail is None:
+            detail = self._get_poi_detail(poi_id)
+            if "raw" not in detail:
+                self._cache_set(key, detail)
+
+        if detail_cache is not None:
+            detail_cache[poi_id] = detail
+        return detail
+
+    def _get_poi_detail(self, poi_id: str) -> Dict[str, Any]:
         try:
             result = self.mcp_tool.run({
                 "action": "call_tool",
@@ -583,16 +807,11 @@ class AmapService:
                 }
             })
 
-            print(f"POI详情结果: {result[:200]}...")
+            logger.debug("POI详情结果: %.200s...", result)
 
             # 解析结果并提取图片
-            import json
-            import re
-
-            # 尝试从结果中提取JSON
-            json_match = re.search(r'\{.*\}', result, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
+            data = _try_parse_mcp_payload(result)
+            if isinstance(data, dict):
                 return data
 
             return {"raw": result}
@@ -604,6 +823,7 @@ class AmapService:
 
 # 创建全局服务实例
 _amap_service = None
+_amap_service_lock = threading.Lock()
 
 
 def get_amap_service() -> AmapService:
@@ -611,7 +831,10 @@ def get_amap_service() -> AmapService:
     global _amap_service
     
     if _amap_service is None:
-        _amap_service = AmapService()
+        # 启动预热线程与首个请求可能同时进入,加锁避免重复启动MCP子进程
+        with _amap_service_lock:
+            if _amap_service is None:
+                _amap_service = AmapService()
     
     return _amap_service
 